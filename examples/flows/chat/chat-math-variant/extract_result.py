@@ -7,9 +7,22 @@ import re
 # Please update the function name/signature per need
 
 
+_STRIP_PATTERN = re.compile(r'[$\\!]')
+
+
 @tool
 def my_python_tool(input1: str) -> str:
-    input1 = re.sub(r'[$\\!]', '', input1)
+    # Most responses contain none of the stripped characters, so try parsing
+    # those directly and only fall back to the regex strip otherwise. The strip
+    # must stay unconditional when a match exists: even valid JSON may carry
+    # '$', '\' or '!' inside the answer value, and those are stripped too.
+    if not _STRIP_PATTERN.search(input1):
+        try:
+            return json.loads(input1)['answer']
+        except Exception:
+            pass
+
+    input1 = _STRIP_PATTERN.sub('', input1)
     try:
         json_answer = json.loads(input1)
         answer = json_answer['answer']
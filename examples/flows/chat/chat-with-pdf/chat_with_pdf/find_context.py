@@ -6,15 +6,19 @@ from utils.index import FAISSIndex
 from utils.oai import OAIEmbedding, render_with_token_limit
 from utils.logging import log
 
+# Module-level environment so compiled templates are cached across calls:
+# the loader only recompiles when the prompt file's mtime changes.
+template_env = Environment(
+    loader=FileSystemLoader(os.path.dirname(os.path.abspath(__file__)))
+)
+
 
 def find_context(question: str, index_path: str):
     index = FAISSIndex(index=faiss.IndexFlatL2(1536), embedding=OAIEmbedding())
     index.load(path=index_path)
     snippets = index.query(question, top_k=5)
 
-    template = Environment(
-        loader=FileSystemLoader(os.path.dirname(os.path.abspath(__file__)))
-    ).get_template("qna_prompt.md")
+    template = template_env.get_template("qna_prompt.md")
     token_limit = int(os.environ.get("PROMPT_TOKEN_LIMIT"))
 
     # Try to render the template with token limit and reduce snippet count if it fails
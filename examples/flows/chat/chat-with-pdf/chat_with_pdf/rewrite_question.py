@@ -3,11 +3,15 @@ import os
 from utils.logging import log
 from utils.oai import OAIChat, render_with_token_limit
 
+# Module-level environment so compiled templates are cached across calls:
+# the loader only recompiles when the prompt file's mtime changes.
+template_env = Environment(
+    loader=FileSystemLoader(os.path.dirname(os.path.abspath(__file__)))
+)
+
 
 def rewrite_question(question: str, history: list):
-    template = Environment(
-        loader=FileSystemLoader(os.path.dirname(os.path.abspath(__file__)))
-    ).get_template("rewrite_question_prompt.md")
+    template = template_env.get_template("rewrite_question_prompt.md")
     token_limit = int(os.environ["PROMPT_TOKEN_LIMIT"])
     max_completion_tokens = int(os.environ["MAX_COMPLETION_TOKENS"])
 
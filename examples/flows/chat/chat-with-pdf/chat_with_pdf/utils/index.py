@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, List, Optional
 from dataclasses import dataclass
 from faiss import Index
@@ -31,13 +32,14 @@ class FAISSIndex:
     def insert_batch(
         self, texts: Iterable[str], metadatas: Optional[List[dict]] = None
     ) -> None:
-        documents = []
-        vectors = []
-        for i, text in enumerate(texts):
-            metadata = metadatas[i] if metadatas else {}
-            vector = self.embedding.generate(text)
-            documents.append((text, metadata))
-            vectors.append(vector)
+        texts = list(texts)
+        documents = [
+            (text, metadatas[i] if metadatas else {}) for i, text in enumerate(texts)
+        ]
+        # Embedding calls are independent network round-trips, so fan them out
+        # concurrently instead of paying one serialized round-trip per chunk.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            vectors = list(executor.map(self.embedding.generate, texts))
 
         self.index.add(np.array(vectors, dtype=np.float32))
         self.docs.update(
@@ -2,6 +2,7 @@ from typing import List
 import openai
 from openai.version import VERSION as OPENAI_VERSION
 import os
+import re
 import tiktoken
 from jinja2 import Template
 
@@ -11,12 +12,13 @@ from .retry import (
 )
 from .logging import log
 
+RATE_LIMIT_DELAY_PATTERN = re.compile(r"retry after (\d+)")
+
+_client_cache = {}
 
-def extract_delay_from_rate_limit_error_msg(text):
-    import re
 
-    pattern = r"retry after (\d+)"
-    match = re.search(pattern, text)
+def extract_delay_from_rate_limit_error_msg(text):
+    match = RATE_LIMIT_DELAY_PATTERN.search(text)
     if match:
         retry_time_from_message = match.group(1)
         return float(retry_time_from_message)
@@ -65,7 +67,13 @@ class OAI:
             from openai import AzureOpenAI as Client
         else:
             from openai import OpenAI as Client
-        self.client = Client(**init_params)
+        # OAI helpers are constructed per call while the environment-derived
+        # config rarely changes, so build one client per config and reuse it.
+        cache_key = (Client, tuple(sorted(init_params.items())))
+        client = _client_cache.get(cache_key)
+        if client is None:
+            client = _client_cache[cache_key] = Client(**init_params)
+        self.client = client
 
 
 class OAIChat(OAI):
@@ -7,6 +7,10 @@ from promptflow.connections import AzureOpenAIConnection, OpenAIConnection
 from chat_with_pdf.utils.lock import acquire_lock
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__)) + "/chat_with_pdf/"
+# Resolve the paths touched on every call once at import time.
+CREATE_FOLDER_LOCK_PATH = BASE_DIR + "create_folder.lock"
+PDF_DIR_PATH = BASE_DIR + ".pdfs"
+INDEX_PDF_DIR_PATH = BASE_DIR + ".index/.pdfs"
 
 
 @tool
@@ -28,10 +32,10 @@ def setup_env(connection: Union[AzureOpenAIConnection, OpenAIConnection], config
     for key in config:
         os.environ[key] = str(config[key])
 
-    with acquire_lock(BASE_DIR + "create_folder.lock"):
-        if not os.path.exists(BASE_DIR + ".pdfs"):
-            os.mkdir(BASE_DIR + ".pdfs")
-        if not os.path.exists(BASE_DIR + ".index/.pdfs"):
-            os.makedirs(BASE_DIR + ".index/.pdfs")
+    with acquire_lock(CREATE_FOLDER_LOCK_PATH):
+        if not os.path.exists(PDF_DIR_PATH):
+            os.mkdir(PDF_DIR_PATH)
+        if not os.path.exists(INDEX_PDF_DIR_PATH):
+            os.makedirs(INDEX_PDF_DIR_PATH)
 
     return "Ready"
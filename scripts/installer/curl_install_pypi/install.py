@@ -35,15 +35,17 @@ PFS_DISPATCH_TEMPLATE = """#!/usr/bin/env bash
 {install_dir}/bin/python -m promptflow._sdk._service.entry "$@"
 """
 
-DEFAULT_INSTALL_DIR = os.path.expanduser(os.path.join('~', 'lib', 'promptflow'))
-DEFAULT_EXEC_DIR = os.path.expanduser(os.path.join('~', 'bin'))
+USER_HOME = os.path.expanduser('~')
+
+DEFAULT_INSTALL_DIR = os.path.join(USER_HOME, 'lib', 'promptflow')
+DEFAULT_EXEC_DIR = os.path.join(USER_HOME, 'bin')
 PF_EXECUTABLE_NAME = 'pf'
 PFAZURE_EXECUTABLE_NAME = 'pfazure'
 PFS_EXECUTABLE_NAME = 'pfs'
 
 
-USER_BASH_RC = os.path.expanduser(os.path.join('~', '.bashrc'))
-USER_BASH_PROFILE = os.path.expanduser(os.path.join('~', '.bash_profile'))
+USER_BASH_RC = os.path.join(USER_HOME, '.bashrc')
+USER_BASH_PROFILE = os.path.join(USER_HOME, '.bash_profile')
 
 
 class CLIInstallError(Exception):
@@ -85,6 +87,13 @@ def exec_command(command_list, cwd=None, env=None):
     subprocess.check_call(command_list, cwd=cwd, env=env)
 
 
+def normalize_input_path(path):
+    # Only pay for expanduser when the input actually starts with '~'.
+    if path.startswith('~'):
+        path = os.path.expanduser(path)
+    return os.path.realpath(path)
+
+
 def create_tmp_dir():
     tmp_dir = tempfile.mkdtemp()
     return tmp_dir
@@ -97,10 +106,17 @@ def create_dir(dir):
 
 
 def is_valid_sha256sum(a_file, expected_sum):
-    sha256 = hashlib.sha256()
     with open(a_file, 'rb') as f:
-        sha256.update(f.read())
-    computed_hash = sha256.hexdigest()
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: hashes with zero-copy reads in C, using the
+            # hardware-accelerated SHA implementation where available.
+            computed_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+        else:
+            sha256 = hashlib.sha256()
+            # Hash in fixed-size chunks instead of reading the whole file into memory.
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+            computed_hash = sha256.hexdigest()
     return expected_sum == computed_hash
 
 
@@ -111,13 +127,12 @@ def create_virtualenv(install_dir):
 
 def install_cli(install_dir, tmp_dir):
     path_to_pip = os.path.join(install_dir, 'bin', 'pip')
-    cmd = [path_to_pip, 'install', '--cache-dir', tmp_dir, 'promptflow[azure,executable,azureml-serving]',
+    # Install everything in one pip invocation so the packages share a single
+    # resolver pass and download session instead of three sequential runs.
+    cmd = [path_to_pip, 'install', '--cache-dir', tmp_dir,
+           'promptflow[azure,executable,azureml-serving]', 'promptflow-tools', 'keyrings.alt',
            '--upgrade']
     exec_command(cmd)
-    cmd = [path_to_pip, 'install', '--cache-dir', tmp_dir, 'promptflow-tools', '--upgrade']
-    exec_command(cmd)
-    cmd = [path_to_pip, 'install', '--cache-dir', tmp_dir, 'keyrings.alt', '--upgrade']
-    exec_command(cmd)
 
 
 def create_executable(exec_dir, install_dir):
@@ -141,7 +156,7 @@ def get_install_dir():
     while not install_dir:
         prompt_message = 'In what directory would you like to place the install?'
         install_dir = prompt_input_with_default(prompt_message, DEFAULT_INSTALL_DIR)
-        install_dir = os.path.realpath(os.path.expanduser(install_dir))
+        install_dir = normalize_input_path(install_dir)
         if ' ' in install_dir:
             print_status("The install directory '{}' cannot contain spaces.".format(install_dir))
             install_dir = None
@@ -167,7 +182,7 @@ def get_exec_dir():
         prompt_message = (f"In what directory would you like to place the "
                           f"'{PFS_EXECUTABLE_NAME}/{PFS_EXECUTABLE_NAME}/{PFAZURE_EXECUTABLE_NAME}' executable?")
         exec_dir = prompt_input_with_default(prompt_message, DEFAULT_EXEC_DIR)
-        exec_dir = os.path.realpath(os.path.expanduser(exec_dir))
+        exec_dir = normalize_input_path(exec_dir)
         if ' ' in exec_dir:
             print_status("The executable directory '{}' cannot contain spaces.".format(exec_dir))
             exec_dir = None
@@ -205,11 +220,11 @@ def _default_rc_file_creation_step():
 
 
 def _find_line_in_file(file_path, search_pattern):
+    # The pattern never spans lines, so one substring scan over the whole file
+    # replaces the per-line Python loop.
     try:
         with open(file_path, 'r', encoding="utf-8") as search_file:
-            for line in search_file:
-                if search_pattern in line:
-                    return True
+            return search_pattern in search_file.read()
     except (OSError, IOError):
         pass
     return False
@@ -228,7 +243,7 @@ def get_rc_file_path():
         rc_file = _default_rc_file_creation_step()
     rc_file = rc_file or prompt_input_with_default('Enter a path to an rc file to update', default_rc_file)
     if rc_file:
-        rc_file_path = os.path.realpath(os.path.expanduser(rc_file))
+        rc_file_path = normalize_input_path(rc_file)
         if os.path.isfile(rc_file_path):
             return rc_file_path
         print_status("The file '{}' could not be found.".format(rc_file_path))
@@ -239,11 +254,18 @@ def warn_other_azs_on_path(exec_dir, exec_filepath):
     env_path = os.environ.get('PATH')
     conflicting_paths = []
     if env_path:
-        for p in env_path.split(':'):
-            for file in [PF_EXECUTABLE_NAME, PFAZURE_EXECUTABLE_NAME, PFS_EXECUTABLE_NAME]:
-                p_to_pf = os.path.join(p, file)
-                if p != exec_dir and os.path.isfile(p_to_pf):
-                    conflicting_paths.append(p_to_pf)
+        targets = {PF_EXECUTABLE_NAME, PFAZURE_EXECUTABLE_NAME, PFS_EXECUTABLE_NAME}
+        for p in env_path.split(os.pathsep):
+            if p == exec_dir:
+                continue
+            # One scandir per directory instead of one stat per executable name.
+            try:
+                with os.scandir(p) as entries:
+                    for entry in entries:
+                        if entry.name in targets and entry.is_file():
+                            conflicting_paths.append(os.path.join(p, entry.name))
+            except OSError:
+                pass
     if conflicting_paths:
         print_status()
         print_status(f"** WARNING: Other '{PFS_EXECUTABLE_NAME}/{PFS_EXECUTABLE_NAME}/{PFAZURE_EXECUTABLE_NAME}' "
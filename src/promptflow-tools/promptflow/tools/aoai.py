@@ -7,7 +7,8 @@ except Exception:
         "Please upgrade your OpenAI package to version 1.0.0 or later using the command: pip install --upgrade openai.")
 
 from promptflow.tools.common import render_jinja_template, handle_openai_error, parse_chat, to_bool, \
-    validate_functions, process_function_call, post_process_chat_api_response, normalize_connection_config
+    validate_functions, process_function_call, post_process_chat_api_response, normalize_connection_config, \
+    get_cached_openai_client
 
 # Avoid circular dependencies: Use import 'from promptflow._internal' instead of 'from promptflow'
 # since the code here is in promptflow namespace as well
@@ -21,11 +22,9 @@ class AzureOpenAI(ToolProvider):
         super().__init__()
         self.connection = connection
         self._connection_dict = normalize_connection_config(self.connection)
-        self._client = AzureOpenAIClient(
-            # disable OpenAI's built-in retry mechanism by using our own retry
-            # for better debuggability and real-time status updates.
-            max_retries=0,
-            **self._connection_dict)
+        # disable OpenAI's built-in retry mechanism by using our own retry
+        # for better debuggability and real-time status updates.
+        self._client = get_cached_openai_client(AzureOpenAIClient, self._connection_dict, max_retries=0)
 
     def calculate_cache_string_for_completion(
         self,
@@ -94,8 +93,8 @@ class AzureOpenAI(ToolProvider):
             def generator():
                 for chunk in response:
                     if chunk.choices:
-                        yield chunk.choices[0].text if hasattr(chunk.choices[0], 'text') and \
-                               chunk.choices[0].text is not None else ""
+                        text = getattr(chunk.choices[0], "text", None)
+                        yield text if text is not None else ""
 
             # We must return the generator object, not using yield directly here.
             # Otherwise, the function itself will become a generator, despite whether stream is True or False.
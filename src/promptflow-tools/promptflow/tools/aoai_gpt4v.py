@@ -11,7 +11,7 @@ from promptflow.exceptions import ErrorTarget, UserErrorException
 from typing import List, Dict
 
 from promptflow.tools.common import render_jinja_template, handle_openai_error, parse_chat, \
-    preprocess_template_string, find_referenced_image_set, convert_to_chat_list, normalize_connection_config, \
+    preprocess_template_string, convert_to_chat_list_and_find_images, normalize_connection_config, \
     post_process_chat_api_response
 
 
@@ -176,12 +176,10 @@ class AzureOpenAI(ToolProvider):
     ) -> str:
         # keep_trailing_newline=True is to keep the last \n in the prompt to avoid converting "user:\t\n" to "user:".
         prompt = preprocess_template_string(prompt)
-        referenced_images = find_referenced_image_set(kwargs)
-
-        # convert list type into ChatInputList type
-        converted_kwargs = convert_to_chat_list(kwargs)
+        # one walk converts list type into ChatInputList type and collects referenced images
+        converted_kwargs, referenced_images = convert_to_chat_list_and_find_images(kwargs)
         chat_str = render_jinja_template(prompt, trim_blocks=True, keep_trailing_newline=True, **converted_kwargs)
-        messages = parse_chat(chat_str, list(referenced_images))
+        messages = parse_chat(chat_str, referenced_images)
 
         headers = {
             "Content-Type": "application/json",
@@ -3,9 +3,11 @@ import json
 import re
 import sys
 import time
+import weakref
 from typing import List, Mapping
 
-from jinja2 import Template
+import httpx
+from jinja2 import Environment
 from openai import APIConnectionError, APIStatusError, OpenAIError, RateLimitError, APITimeoutError
 from promptflow.tools.exception import ChatAPIInvalidRole, WrappedOpenAIError, LLMError, JinjaTemplateError, \
     ExceedMaxRetryTimes, ChatAPIInvalidFunctions, FunctionCallNotSupportedInStreamMode, \
@@ -27,9 +29,16 @@ class ChatInputList(list):
         return "\n".join(map(str, self))
 
 
+# Shared defaults so role validation does not allocate a fresh list per call;
+# parse_chat keeps its own ordering for backward-compatible error messages.
+_DEFAULT_VALID_ROLES = ["assistant", "function", "user", "system"]
+_PARSE_CHAT_DEFAULT_ROLES = ["system", "user", "assistant", "function"]
+_PARSE_CHAT_DEFAULT_ROLES_SET = frozenset(_PARSE_CHAT_DEFAULT_ROLES)
+
+
 def validate_role(role: str, valid_roles: List[str] = None):
     if not valid_roles:
-        valid_roles = ["assistant", "function", "user", "system"]
+        valid_roles = _DEFAULT_VALID_ROLES
 
     if role not in valid_roles:
         valid_roles_str = ','.join([f'\'{role}:\\n\'' for role in valid_roles])
@@ -43,63 +52,157 @@ def validate_role(role: str, valid_roles: List[str] = None):
         raise ChatAPIInvalidRole(message=error_message)
 
 
-def validate_functions(functions):
-    function_example = json.dumps({
-        "name": "function_name",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "parameter_name": {
-                    "type": "integer",
-                    "description": "parameter_description"
-                }
+# Constant guidance strings, serialized once at import instead of per failure.
+_FUNCTION_EXAMPLE = json.dumps({
+    "name": "function_name",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "parameter_name": {
+                "type": "integer",
+                "description": "parameter_description"
             }
-        },
-        "description": "function_description"
-    })
-    common_tsg = f"Here is a valid function example: {function_example}. See more details at " \
+        }
+    },
+    "description": "function_description"
+})
+_FUNCTIONS_TSG = f"Here is a valid function example: {_FUNCTION_EXAMPLE}. See more details at " \
                  "https://platform.openai.com/docs/api-reference/chat/create#chat/create-functions " \
                  "or view sample 'How to use functions with chat models' in our gallery."
+
+_FUNCTION_CALL_EXAMPLE = json.dumps({"name": "function_name"})
+_FUNCTION_CALL_TSG = f"Here is a valid example: {_FUNCTION_CALL_EXAMPLE}. See the guide at " \
+                     "https://platform.openai.com/docs/api-reference/chat/create#chat/create-function_call " \
+                     "or view sample 'How to call functions with chat models' in our gallery."
+
+
+def validate_functions(functions):
     if len(functions) == 0:
-        raise ChatAPIInvalidFunctions(message=f"functions cannot be an empty list. {common_tsg}")
+        raise ChatAPIInvalidFunctions(message=f"functions cannot be an empty list. {_FUNCTIONS_TSG}")
     else:
         for i, function in enumerate(functions):
             # validate if the function is a dict
             if not isinstance(function, dict):
-                raise ChatAPIInvalidFunctions(message=f"function {i} '{function}' is not a dict. {common_tsg}")
+                raise ChatAPIInvalidFunctions(message=f"function {i} '{function}' is not a dict. {_FUNCTIONS_TSG}")
             # validate if has required keys
             for key in ["name", "parameters"]:
                 if key not in function.keys():
                     raise ChatAPIInvalidFunctions(
-                        message=f"function {i} '{function}' does not have '{key}' property. {common_tsg}")
+                        message=f"function {i} '{function}' does not have '{key}' property. {_FUNCTIONS_TSG}")
             # validate if the parameters is a dict
             if not isinstance(function["parameters"], dict):
                 raise ChatAPIInvalidFunctions(
                     message=f"function {i} '{function['name']}' parameters '{function['parameters']}' "
-                            f"should be described as a JSON Schema object. {common_tsg}")
+                            f"should be described as a JSON Schema object. {_FUNCTIONS_TSG}")
             # validate if the parameters has required keys
             for key in ["type", "properties"]:
                 if key not in function["parameters"].keys():
                     raise ChatAPIInvalidFunctions(
                         message=f"function {i} '{function['name']}' parameters '{function['parameters']}' "
-                                f"does not have '{key}' property. {common_tsg}")
+                                f"does not have '{key}' property. {_FUNCTIONS_TSG}")
             # validate if the parameters type is object
             if function["parameters"]["type"] != "object":
                 raise ChatAPIInvalidFunctions(
                     message=f"function {i} '{function['name']}' parameters 'type' "
-                            f"should be 'object'. {common_tsg}")
+                            f"should be 'object'. {_FUNCTIONS_TSG}")
             # validate if the parameters properties is a dict
             if not isinstance(function["parameters"]["properties"], dict):
                 raise ChatAPIInvalidFunctions(
                     message=f"function {i} '{function['name']}' parameters 'properties' "
-                            f"should be described as a JSON Schema object. {common_tsg}")
+                            f"should be described as a JSON Schema object. {_FUNCTIONS_TSG}")
+
+
+# customer can add ## in front of name/content for markdown highlight.
+# and we still support name/content without ## prefix for backward compatibility.
+_NAME_CONTENT_PATTERN = re.compile(r"\n*#{0,2}\s*name:\n+\s*(\S+)\s*\n*#{0,2}\s*content:\n?(.*)", re.DOTALL)
+
+
+def _try_parse_role_header(line: str, valid_roles: frozenset):
+    # A role header is a line holding nothing but the role name and a colon,
+    # optionally prefixed with a single '#' for markdown highlight; role name
+    # without '#' prefix is still supported for backward compatibility. The
+    # line must be '\n'-terminated, matching the retired regex separator.
+    if not line.endswith("\n"):
+        return None
+    stripped = line.strip()
+    has_hash_prefix = stripped.startswith("#")
+    if has_hash_prefix:
+        stripped = stripped[1:].lstrip()
+    if not stripped.endswith(":"):
+        return None
+    # Interning collapses the repeated role strings across messages/calls to
+    # shared objects, making downstream equality checks pointer comparisons.
+    role = sys.intern(stripped[:-1].rstrip().lower())
+    if role in valid_roles:
+        return role, has_hash_prefix
+    return None
+
+
+def _try_parse_bare_role(line: str, valid_roles: frozenset):
+    # First half of a header whose colon sits on a later line: nothing but the
+    # role name, optionally '#'-prefixed. The retired separator's `\s*` matched
+    # newlines, so 'user' and ':' arriving on separate lines formed a header.
+    stripped = line.strip()
+    has_hash_prefix = stripped.startswith("#")
+    if has_hash_prefix:
+        stripped = stripped[1:].lstrip()
+    role = stripped.lower()
+    if role in valid_roles:
+        return sys.intern(role), has_hash_prefix
+    return None
+
+
+def _split_chat_by_role_headers(chat_str: str, valid_roles: frozenset):
+    """
+    Split the chat string into [text, role, text, role, ..., text] chunks, like
+    re.split with a capturing role-separator pattern, but with a single
+    line-oriented scan instead of regex alternation over the whole string.
+    """
+    chunks = []
+    pending_lines = []
+    lines = chat_str.splitlines(keepends=True)
+    n = len(lines)
+    i = 0
+    while i < n:
+        line = lines[i]
+        next_i = i + 1
+        header = _try_parse_role_header(line, valid_roles)
+        if header is None:
+            bare = _try_parse_bare_role(line, valid_roles)
+            if bare is not None:
+                # a header may be split across lines: the role name alone,
+                # whitespace-only lines, then a lone '\n'-terminated colon
+                j = next_i
+                while j < n and lines[j].strip() == "":
+                    j += 1
+                if j < n and lines[j].endswith("\n") and lines[j].strip() == ":":
+                    header = bare
+                    next_i = j + 1
+        if header is None:
+            pending_lines.append(line)
+            i = next_i
+            continue
+        role, has_hash_prefix = header
+        chunk = "".join(pending_lines)
+        pending_lines.clear()
+        if not has_hash_prefix:
+            # The markdown '#' may also sit on its own, possibly indented, line
+            # above the header; the retired multiline separator consumed it
+            # (and its indentation), so fold it out of the preceding chunk.
+            tail = chunk.rstrip()
+            if tail.endswith("#"):
+                head = tail[:-1].rstrip(" \t")
+                if head == "" or head.endswith("\n"):
+                    chunk = head
+        chunks.append(chunk)
+        chunks.append(role)
+        i = next_i
+    chunks.append("".join(pending_lines))
+    return chunks
 
 
 def try_parse_name_and_content(role_prompt):
-    # customer can add ## in front of name/content for markdown highlight.
-    # and we still support name/content without ## prefix for backward compatibility.
-    pattern = r"\n*#{0,2}\s*name:\n+\s*(\S+)\s*\n*#{0,2}\s*content:\n?(.*)"
-    match = re.search(pattern, role_prompt, re.DOTALL)
+    match = _NAME_CONTENT_PATTERN.search(role_prompt)
     if match:
         return match.group(1), match.group(2)
     return None
@@ -107,17 +210,16 @@ def try_parse_name_and_content(role_prompt):
 
 def parse_chat(chat_str, images: List = None, valid_roles: List[str] = None):
     if not valid_roles:
-        valid_roles = ["system", "user", "assistant", "function"]
-
-    # openai chat api only supports below roles.
-    # customer can add single # in front of role name for markdown highlight.
-    # and we still support role name without # prefix for backward compatibility.
-    separator = r"(?i)^\s*#?\s*(" + "|".join(valid_roles) + r")\s*:\s*\n"
+        valid_roles = _PARSE_CHAT_DEFAULT_ROLES
+        valid_roles_set = _PARSE_CHAT_DEFAULT_ROLES_SET
+    else:
+        valid_roles_set = frozenset(role.lower() for role in valid_roles)
 
-    images = images or []
-    hash2images = {str(x): x for x in images}
+    # No comprehension machinery when there are no images (the common case);
+    # the empty dict also lets to_content_str_or_list skip its line scan.
+    hash2images = {str(x): x for x in images} if images else {}
 
-    chunks = re.split(separator, chat_str, flags=re.MULTILINE)
+    chunks = _split_chat_by_role_headers(chat_str, valid_roles_set)
     chat_list = []
 
     for chunk in chunks:
@@ -155,37 +257,81 @@ def parse_chat(chat_str, images: List = None, valid_roles: List[str] = None):
 
 def to_content_str_or_list(chat_str: str, hash2images: Mapping):
     chat_str = chat_str.strip()
-    chunks = chat_str.split("\n")
+    # Text-only chat is the common case; skip the line scan entirely.
+    if not hash2images:
+        return chat_str
     include_image = False
     result = []
-    for chunk in chunks:
-        if chunk.strip() in hash2images:
-            image_message = {}
-            image_message["type"] = "image_url"
-            image_url = hash2images[chunk.strip()].source_url \
-                if hasattr(hash2images[chunk.strip()], "source_url") else None
+    for chunk in chat_str.split("\n"):
+        stripped_chunk = chunk.strip()
+        image = hash2images.get(stripped_chunk)
+        if image is not None:
+            image_url = getattr(image, "source_url", None)
             if not image_url:
-                image_bs64 = hash2images[chunk.strip()].to_base64()
-                image_mine_type = hash2images[chunk.strip()]._mime_type
-                image_url = {"url": f"data:{image_mine_type};base64,{image_bs64}"}
-            image_message["image_url"] = image_url
-            result.append(image_message)
+                image_url = {"url": f"data:{image._mime_type};base64,{image.to_base64()}"}
+            result.append({"type": "image_url", "image_url": image_url})
             include_image = True
-        elif chunk.strip() == "":
+        elif stripped_chunk == "":
             continue
         else:
             result.append({"type": "text", "text": chunk})
     return result if include_image else chat_str
 
 
-def generate_retry_interval(retry_count: int) -> float:
-    min_backoff_in_sec = 3
-    max_backoff_in_sec = 60
-    retry_interval = min_backoff_in_sec + ((2 ** retry_count) - 1)
+# Exponential backoff table (base 3s, capped at 60s), precomputed for the
+# default tries=100 so each retry is a tuple subscript instead of a 2**n op.
+_MAX_BACKOFF_IN_SEC = 60
+_RETRY_INTERVALS = tuple(min(_MAX_BACKOFF_IN_SEC, 3 + (1 << i) - 1) for i in range(101))
+
 
-    if retry_interval > max_backoff_in_sec:
-        retry_interval = max_backoff_in_sec
-    return retry_interval
+def generate_retry_interval(retry_count: int) -> float:
+    if retry_count < len(_RETRY_INTERVALS):
+        return _RETRY_INTERVALS[retry_count]
+    return _MAX_BACKOFF_IN_SEC
+
+
+def _raise_if_connection_error_not_retriable(e):
+    # Only timeouts and aborted connections are worth retrying; other
+    # connection failures (DNS, TLS, proxy) won't heal within the retry window.
+    if not isinstance(e, APITimeoutError) and "connection aborted" not in str(e).lower():
+        raise WrappedOpenAIError(e)
+
+
+def _raise_if_status_error_not_retriable(e):
+    # Retry InternalServerError(>=500), RateLimitError(429), UnprocessableEntityError(422)
+    status_code = e.response.status_code
+    if status_code < 500 and status_code not in [429, 422]:
+        raise WrappedOpenAIError(e)
+    if isinstance(e, RateLimitError) and getattr(e, "type", None) == "insufficient_quota":
+        # Exit retry if this is quota insufficient error
+        print(f"{type(e).__name__} with insufficient quota. Throw user error.", file=sys.stderr)
+        raise WrappedOpenAIError(e)
+
+
+def _sleep_before_retry(e, retry_count, tries):
+    if retry_count == tries:
+        # Exit retry if max retry reached
+        print(f"{type(e).__name__} reached max retry. Exit retry with user error.", file=sys.stderr)
+        raise ExceedMaxRetryTimes(e)
+
+    response = getattr(e, "response", None)
+    retry_after_in_header = response.headers.get("retry-after", None) if response is not None else None
+
+    if not retry_after_in_header:
+        retry_after_seconds = generate_retry_interval(retry_count)
+        msg = (
+            f"{type(e).__name__} #{retry_count}, but no Retry-After header, "
+            + f"Back off {retry_after_seconds} seconds for retry."
+        )
+        print(msg, file=sys.stderr)
+    else:
+        retry_after_seconds = float(retry_after_in_header)
+        msg = (
+            f"{type(e).__name__} #{retry_count}, Retry-After={retry_after_in_header}, "
+            f"Back off {retry_after_seconds} seconds for retry."
+        )
+        print(msg, file=sys.stderr)
+    time.sleep(retry_after_seconds)
 
 
 # TODO(2971352): revisit this tries=100 when there is any change to the 10min timeout logic
@@ -197,6 +343,11 @@ def handle_openai_error(tries: int = 100):
     For retriable error, the decorator use below parameters to control its retry activity with exponential backoff:
      `tries` : max times for the function invocation, type is int
      'delay': base delay seconds for exponential delay, type is float
+
+    The wrapper itself stays minimal so the happy path only pays for one
+    try/except frame; classification and backoff live in module helpers and the
+    interpreter's exception matching picks the branch instead of isinstance
+    ladders in the handler body.
     """
 
     def decorator(func):
@@ -208,47 +359,16 @@ def handle_openai_error(tries: int = 100):
                 except (SystemErrorException, UserErrorException) as e:
                     # Throw inner wrapped exception directly
                     raise e
-                except (APIStatusError, APIConnectionError) as e:
+                except APIConnectionError as e:
                     #  Handle retriable exception, please refer to
                     #  https://platform.openai.com/docs/guides/error-codes/api-errors
                     print(f"Exception occurs: {type(e).__name__}: {str(e)}", file=sys.stderr)
-                    if isinstance(e, APIConnectionError) and not isinstance(e, APITimeoutError) \
-                            and "connection aborted" not in str(e).lower():
-                        raise WrappedOpenAIError(e)
-                    # Retry InternalServerError(>=500), RateLimitError(429), UnprocessableEntityError(422)
-                    if isinstance(e, APIStatusError):
-                        status_code = e.response.status_code
-                        if status_code < 500 and status_code not in [429, 422]:
-                            raise WrappedOpenAIError(e)
-                    if isinstance(e, RateLimitError) and getattr(e, "type", None) == "insufficient_quota":
-                        # Exit retry if this is quota insufficient error
-                        print(f"{type(e).__name__} with insufficient quota. Throw user error.", file=sys.stderr)
-                        raise WrappedOpenAIError(e)
-                    if i == tries:
-                        # Exit retry if max retry reached
-                        print(f"{type(e).__name__} reached max retry. Exit retry with user error.", file=sys.stderr)
-                        raise ExceedMaxRetryTimes(e)
-
-                    if hasattr(e, 'response') and e.response is not None:
-                        retry_after_in_header = e.response.headers.get("retry-after", None)
-                    else:
-                        retry_after_in_header = None
-
-                    if not retry_after_in_header:
-                        retry_after_seconds = generate_retry_interval(i)
-                        msg = (
-                            f"{type(e).__name__} #{i}, but no Retry-After header, "
-                            + f"Back off {retry_after_seconds} seconds for retry."
-                        )
-                        print(msg, file=sys.stderr)
-                    else:
-                        retry_after_seconds = float(retry_after_in_header)
-                        msg = (
-                            f"{type(e).__name__} #{i}, Retry-After={retry_after_in_header}, "
-                            f"Back off {retry_after_seconds} seconds for retry."
-                        )
-                        print(msg, file=sys.stderr)
-                    time.sleep(retry_after_seconds)
+                    _raise_if_connection_error_not_retriable(e)
+                    _sleep_before_retry(e, i, tries)
+                except APIStatusError as e:
+                    print(f"Exception occurs: {type(e).__name__}: {str(e)}", file=sys.stderr)
+                    _raise_if_status_error_not_retriable(e)
+                    _sleep_before_retry(e, i, tries)
                 except OpenAIError as e:
                     # For other non-retriable errors from OpenAIError,
                     # For example, AuthenticationError, APIConnectionError, BadRequestError, NotFoundError
@@ -269,9 +389,30 @@ def to_bool(value) -> bool:
     return str(value).lower() == "true"
 
 
+# Shared environments for prompt rendering, keyed by the flags render_jinja_template
+# accepts, so every call reuses one Environment instead of rebuilding parser state.
+_jinja_environments = {}
+
+
+def _get_jinja_environment(trim_blocks: bool, keep_trailing_newline: bool) -> Environment:
+    key = (trim_blocks, keep_trailing_newline)
+    env = _jinja_environments.get(key)
+    if env is None:
+        env = _jinja_environments[key] = Environment(
+            trim_blocks=trim_blocks, keep_trailing_newline=keep_trailing_newline)
+    return env
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_jinja_template(prompt: str, trim_blocks: bool, keep_trailing_newline: bool):
+    # The common case is one template rendered many times with different kwargs,
+    # so cache the compiled template to pay the parse/compile cost only once.
+    return _get_jinja_environment(trim_blocks, keep_trailing_newline).from_string(prompt)
+
+
 def render_jinja_template(prompt, trim_blocks=True, keep_trailing_newline=True, **kwargs):
     try:
-        return Template(prompt, trim_blocks=trim_blocks, keep_trailing_newline=keep_trailing_newline).render(**kwargs)
+        return _compile_jinja_template(prompt, trim_blocks, keep_trailing_newline).render(**kwargs)
     except Exception as e:
         # For exceptions raised by jinja2 module, mark UserError
         print(f"Exception occurs: {type(e).__name__}: {str(e)}", file=sys.stderr)
@@ -286,19 +427,17 @@ def process_function_call(function_call):
     elif function_call == "auto" or function_call == "none":
         param = function_call
     else:
-        function_call_example = json.dumps({"name": "function_name"})
-        common_tsg = f"Here is a valid example: {function_call_example}. See the guide at " \
-                     "https://platform.openai.com/docs/api-reference/chat/create#chat/create-function_call " \
-                     "or view sample 'How to call functions with chat models' in our gallery."
         param = function_call
         if not isinstance(param, dict):
             raise ChatAPIInvalidFunctions(
-                message=f"function_call parameter '{param}' must be a dict, but not {type(function_call)}. {common_tsg}"
+                message=f"function_call parameter '{param}' must be a dict, but not {type(function_call)}. "
+                        f"{_FUNCTION_CALL_TSG}"
             )
         else:
             if "name" not in function_call:
                 raise ChatAPIInvalidFunctions(
-                    message=f'function_call parameter {json.dumps(param)} must contain "name" field. {common_tsg}'
+                    message=f'function_call parameter {json.dumps(param)} must contain "name" field. '
+                            f'{_FUNCTION_CALL_TSG}'
                 )
     return param
 
@@ -311,9 +450,12 @@ def post_process_chat_api_response(completion, stream, functions):
 
         def generator():
             for chunk in completion:
-                if chunk.choices:
-                    yield chunk.choices[0].delta.content if hasattr(chunk.choices[0].delta, 'content') and \
-                                                            chunk.choices[0].delta.content is not None else ""
+                choices = chunk.choices
+                if choices:
+                    # One getattr with default instead of hasattr plus repeated
+                    # attribute chains; this loop is the streaming hot path.
+                    content = getattr(choices[0].delta, "content", None)
+                    yield content if content is not None else ""
 
         # We must return the generator object, not using yield directly here.
         # Otherwise, the function itself will become a generator, despite whether stream is True or False.
@@ -322,26 +464,21 @@ def post_process_chat_api_response(completion, stream, functions):
         # When calling function, function_call response will be returned as a field in message, so we need return
         # message directly. Otherwise, we only return content.
         if functions is not None:
-            return completion.model_dump()["choices"][0]["message"]
+            # Dump only the message subtree; model_dump() on the whole
+            # completion would materialize every choice plus usage/logprobs
+            # just to throw them away.
+            return completion.choices[0].message.model_dump()
         else:
             # chat api may return message with no content.
             return getattr(completion.choices[0].message, "content", "")
 
 
-def preprocess_template_string(template_string: str) -> str:
-    """Remove the image input decorator from the template string and place the image input in a new line."""
-    pattern = re.compile(r'\!\[(\s*image\s*)\]\(\{\{(\s*[^\s{}]+\s*)\}\}\)')
-
-    # Find all matches in the input string
-    matches = pattern.findall(template_string)
+_IMAGE_DECORATOR_PATTERN = re.compile(r'\!\[(\s*image\s*)\]\(\{\{(\s*[^\s{}]+\s*)\}\}\)')
 
-    # Perform substitutions
-    for match in matches:
-        original = f"![{match[0]}]({{{{{match[1]}}}}})"
-        replacement = f"\n{{{{{match[1]}}}}}\n"
-        template_string = template_string.replace(original, replacement)
 
-    return template_string
+def preprocess_template_string(template_string: str) -> str:
+    """Remove the image input decorator from the template string and place the image input in a new line."""
+    return _IMAGE_DECORATOR_PATTERN.sub(lambda match: f"\n{{{{{match.group(2)}}}}}\n", template_string)
 
 
 def convert_to_chat_list(obj):
@@ -354,14 +491,17 @@ def convert_to_chat_list(obj):
 
 
 def add_referenced_images_to_set(value, image_set, image_type):
-    if isinstance(value, image_type):
-        image_set.add(value)
-    elif isinstance(value, list):
-        for item in value:
-            add_referenced_images_to_set(item, image_set, image_type)
-    elif isinstance(value, dict):
-        for _, item in value.items():
-            add_referenced_images_to_set(item, image_set, image_type)
+    # Iterative traversal: cheaper than a recursive call per nested item and
+    # immune to RecursionError on deeply nested inputs.
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, image_type):
+            image_set.add(current)
+        elif isinstance(current, list):
+            stack.extend(current)
+        elif isinstance(current, dict):
+            stack.extend(current.values())
 
 
 def find_referenced_image_set(kwargs: dict):
@@ -375,6 +515,58 @@ def find_referenced_image_set(kwargs: dict):
     return referenced_images
 
 
+def _convert_and_collect_images(obj, image_set, image_type):
+    if isinstance(obj, dict):
+        return {key: _convert_and_collect_images(value, image_set, image_type) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return ChatInputList(_convert_and_collect_images(item, image_set, image_type) for item in obj)
+    if image_type is not None and isinstance(obj, image_type):
+        image_set.add(obj)
+    return obj
+
+
+def convert_to_chat_list_and_find_images(kwargs: dict):
+    """
+    Fused convert_to_chat_list + find_referenced_image_set: a single traversal of
+    the inputs converts lists to ChatInputList and collects referenced images,
+    instead of walking the same nested structure twice.
+    """
+    try:
+        from promptflow.contracts.multimedia import Image
+    except ImportError:
+        Image = None
+    referenced_images = set()
+    converted = {key: _convert_and_collect_images(value, referenced_images, Image) for key, value in kwargs.items()}
+    return converted, referenced_images
+
+
+# Pool sizing and timeouts for the cached clients. The explicit limits keep
+# highly concurrent serving flows from starving the SDK's default pool, and the
+# long read timeout leaves room for slow generations while still being bounded.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=200, keepalive_expiry=30)
+_HTTP_TIMEOUT = httpx.Timeout(connect=10, read=600, write=60, pool=5)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_openai_client(client_class, config_items, max_retries):
+    http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return client_class(max_retries=max_retries, http_client=http_client, **dict(config_items))
+
+
+def get_cached_openai_client(client_class, connection_config: dict, max_retries: int = 0):
+    """
+    Return an OpenAI/AzureOpenAI client for the given connection config, reusing a
+    cached instance per config so repeated tool invocations share the client's
+    HTTP connection pool instead of paying a new TCP+TLS handshake per call.
+    """
+    return _build_openai_client(client_class, tuple(sorted(connection_config.items())), max_retries)
+
+
+# Connections are long-lived in the runtime, so the normalized config is cached
+# per connection object; weak keys let the entry die with the connection.
+_normalized_config_cache = weakref.WeakKeyDictionary()
+
+
 def normalize_connection_config(connection):
     """
     Normalizes the configuration of a given connection object for compatibility.
@@ -382,19 +574,52 @@ def normalize_connection_config(connection):
     This function takes a connection object and normalizes its configuration,
     ensuring it is compatible and standardized for use.
     """
-    if isinstance(connection, AzureOpenAIConnection):
-        return {
-            "api_key": connection.api_key,
-            "api_version": connection.api_version,
-            "azure_endpoint": connection.api_base
-        }
-    elif isinstance(connection, OpenAIConnection):
-        return {
-            "api_key": connection.api_key,
-            "organization": connection.organization,
-            "base_url": connection.base_url
-        }
-    else:
-        error_message = f"Not Support connection type '{type(connection).__name__}'. " \
-                        f"Connection type should be in [AzureOpenAIConnection, OpenAIConnection]."
-        raise InvalidConnectionType(message=error_message)
+    try:
+        return _normalized_config_cache[connection]
+    except (KeyError, TypeError):
+        pass
+    config = _normalize_connection_config(connection)
+    try:
+        _normalized_config_cache[connection] = config
+    except TypeError:
+        # connection does not support weak references; skip caching.
+        pass
+    return config
+
+
+def _normalize_aoai_connection(connection):
+    return {
+        "api_key": connection.api_key,
+        "api_version": connection.api_version,
+        "azure_endpoint": connection.api_base
+    }
+
+
+def _normalize_openai_connection(connection):
+    return {
+        "api_key": connection.api_key,
+        "organization": connection.organization,
+        "base_url": connection.base_url
+    }
+
+
+# Connection type -> normalizer table, same dispatch pattern as the embedding
+# tool: one dict lookup on the exact type, isinstance only for subclasses.
+_CONNECTION_NORMALIZERS = {
+    AzureOpenAIConnection: _normalize_aoai_connection,
+    OpenAIConnection: _normalize_openai_connection,
+}
+
+
+def _normalize_connection_config(connection):
+    normalizer = _CONNECTION_NORMALIZERS.get(type(connection))
+    if normalizer is None:
+        for connection_type, candidate in _CONNECTION_NORMALIZERS.items():
+            if isinstance(connection, connection_type):
+                normalizer = candidate
+                break
+        else:
+            error_message = f"Not Support connection type '{type(connection).__name__}'. " \
+                            f"Connection type should be in [AzureOpenAIConnection, OpenAIConnection]."
+            raise InvalidConnectionType(message=error_message)
+    return normalizer(connection)
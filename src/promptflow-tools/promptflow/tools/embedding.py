@@ -2,7 +2,7 @@ from enum import Enum
 from typing import Union
 
 from openai import AzureOpenAI as AzureOpenAIClient, OpenAI as OpenAIClient
-from promptflow.tools.common import handle_openai_error, normalize_connection_config
+from promptflow.tools.common import handle_openai_error, normalize_connection_config, get_cached_openai_client
 from promptflow.tools.exception import InvalidConnectionType
 
 # Avoid circular dependencies: Use import 'from promptflow._internal' instead of 'from promptflow'
@@ -17,24 +17,46 @@ class EmbeddingModel(str, Enum):
     TEXT_SEARCH_ADA_QUERY_001 = "text-search-ada-query-001"
 
 
+def _embedding_with_aoai(connection, input, deployment_name, model):
+    # Reuse the cached client so successive embedding calls share one warm
+    # connection pool instead of paying construction and TLS setup each time.
+    client = get_cached_openai_client(AzureOpenAIClient, normalize_connection_config(connection))
+    return client.embeddings.create(
+        input=input,
+        model=deployment_name,
+        extra_headers={"ms-azure-ai-promptflow-called-from": "aoai-tool"}
+    ).data[0].embedding
+
+
+def _embedding_with_openai(connection, input, deployment_name, model):
+    client = get_cached_openai_client(OpenAIClient, normalize_connection_config(connection))
+    return client.embeddings.create(
+        input=input,
+        model=model
+    ).data[0].embedding
+
+
+# Connection type -> handler table, so each call does a single dict lookup
+# instead of walking an isinstance ladder.
+_EMBEDDING_DISPATCH = {
+    AzureOpenAIConnection: _embedding_with_aoai,
+    OpenAIConnection: _embedding_with_openai,
+}
+
+
 @tool
 @handle_openai_error()
 def embedding(connection: Union[AzureOpenAIConnection, OpenAIConnection], input: str, deployment_name: str = "",
               model: EmbeddingModel = EmbeddingModel.TEXT_EMBEDDING_ADA_002):
-    if isinstance(connection, AzureOpenAIConnection):
-        client = AzureOpenAIClient(**normalize_connection_config(connection))
-        return client.embeddings.create(
-            input=input,
-            model=deployment_name,
-            extra_headers={"ms-azure-ai-promptflow-called-from": "aoai-tool"}
-        ).data[0].embedding
-    elif isinstance(connection, OpenAIConnection):
-        client = OpenAIClient(**normalize_connection_config(connection))
-        return client.embeddings.create(
-            input=input,
-            model=model
-        ).data[0].embedding
-    else:
-        error_message = f"Not Support connection type '{type(connection).__name__}' for embedding api. " \
-                        f"Connection type should be in [AzureOpenAIConnection, OpenAIConnection]."
-        raise InvalidConnectionType(message=error_message)
+    handler = _EMBEDDING_DISPATCH.get(type(connection))
+    if handler is None:
+        # keep subclasses of the known connection types working.
+        for connection_type, candidate in _EMBEDDING_DISPATCH.items():
+            if isinstance(connection, connection_type):
+                handler = candidate
+                break
+        else:
+            error_message = f"Not Support connection type '{type(connection).__name__}' for embedding api. " \
+                            f"Connection type should be in [AzureOpenAIConnection, OpenAIConnection]."
+            raise InvalidConnectionType(message=error_message)
+    return handler(connection, input, deployment_name, model)
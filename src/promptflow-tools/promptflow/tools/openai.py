@@ -8,7 +8,7 @@ except Exception:
 
 from promptflow.tools.common import render_jinja_template, handle_openai_error, \
     parse_chat, to_bool, validate_functions, process_function_call, \
-    post_process_chat_api_response, normalize_connection_config
+    post_process_chat_api_response, normalize_connection_config, get_cached_openai_client
 
 # Avoid circular dependencies: Use import 'from promptflow._internal' instead of 'from promptflow'
 # since the code here is in promptflow namespace as well
@@ -32,11 +32,9 @@ class OpenAI(ToolProvider):
     def __init__(self, connection: OpenAIConnection):
         super().__init__()
         self._connection_dict = normalize_connection_config(connection)
-        self._client = OpenAIClient(
-            # disable OpenAI's built-in retry mechanism by using our own retry
-            # for better debuggability and real-time status updates.
-            max_retries=0,
-            **self._connection_dict)
+        # disable OpenAI's built-in retry mechanism by using our own retry
+        # for better debuggability and real-time status updates.
+        self._client = get_cached_openai_client(OpenAIClient, self._connection_dict, max_retries=0)
 
     @tool
     @handle_openai_error()
@@ -90,7 +88,8 @@ class OpenAI(ToolProvider):
             def generator():
                 for chunk in response:
                     if chunk.choices:
-                        yield getattr(chunk.choices[0], "text", "")
+                        text = getattr(chunk.choices[0], "text", None)
+                        yield text if text is not None else ""
 
             # We must return the generator object, not using yield directly here.
             # Otherwise, the function itself will become a generator, despite whether stream is True or False.
@@ -72,6 +72,17 @@ class TestCommon:
                 {'role': 'assistant', 'content': ''},
                 {'role': 'user', 'content': 'second'}
             ]),
+            # the markdown '#' on its own line belongs to the next header, even when indented
+            ("user:\nhello\n\n  #\nassistant:\nhey\n", None, [
+                {'role': 'user', 'content': 'hello'}, {'role': 'assistant', 'content': 'hey'}]),
+            ("user:\nhello\n\n\t#\nassistant:\nhey\n", None, [
+                {'role': 'user', 'content': 'hello'}, {'role': 'assistant', 'content': 'hey'}]),
+            # a '#' attached to a content line is content, not a header prefix
+            ("user:\nhello  #\nassistant:\nhey\n", None, [
+                {'role': 'user', 'content': 'hello  #'}, {'role': 'assistant', 'content': 'hey'}]),
+            # a header may be split across lines: role name first, colon on a later line
+            ("user\n:\nhello\n", None, [{'role': 'user', 'content': 'hello'}]),
+            ("#\nuser\n:\nhello\n", None, [{'role': 'user', 'content': 'hello'}]),
             # todo: enable this test case after we support image_url officially
             # ("#user:\ntell me about the images\nImage(1edf82c2)\nImage(9b65b0f4)", [
             #     Image("image1".encode()), Image("image2".encode(), "image/png", "https://image_url")], [
@@ -53,6 +53,29 @@ class Span(Base):
                 if "UNIQUE constraint failed" not in str(e):
                     raise
 
+    @staticmethod
+    @sqlite_retry
+    def persist_many(spans: typing.List["Span"]) -> None:
+        with trace_mgmt_db_session() as session:
+            try:
+                # one transaction for the whole batch instead of a commit per span
+                session.add_all(spans)
+                session.commit()
+            except IntegrityError as e:
+                if "UNIQUE constraint failed" not in str(e):
+                    raise
+                # duplicate data in the batch (see `persist`); replay row by row
+                # so only the duplicates are skipped
+                session.rollback()
+                for span in spans:
+                    try:
+                        session.add(span)
+                        session.commit()
+                    except IntegrityError as e:
+                        if "UNIQUE constraint failed" not in str(e):
+                            raise
+                        session.rollback()
+
     @staticmethod
     @sqlite_retry
     def list(
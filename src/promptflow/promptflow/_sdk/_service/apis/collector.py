@@ -34,10 +34,14 @@ def trace_collector():
                 SpanResourceFieldName.ATTRIBUTES: resource_attributes,
                 SpanResourceFieldName.SCHEMA_URL: resource_span.schema_url,
             }
-            for scope_span in resource_span.scope_spans:
-                for span in scope_span.spans:
-                    # TODO: persist with batch
-                    Span._from_protobuf_object(span, resource=resource)._persist()
+            spans = [
+                Span._from_protobuf_object(span, resource=resource)
+                for scope_span in resource_span.scope_spans
+                for span in scope_span.spans
+            ]
+            if spans:
+                # persist the whole resource span batch in one transaction
+                Span._persist_many(spans)
         return "Traces received", 200
 
     # JSON protobuf encoding
@@ -2,13 +2,13 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
 
-import copy
 import datetime
+import functools
 import json
+import sys
 import typing
 from dataclasses import dataclass
 
-from google.protobuf.json_format import MessageToJson
 from opentelemetry.proto.trace.v1.trace_pb2 import Span as PBSpan
 
 from promptflow._constants import (
@@ -24,14 +24,74 @@ from promptflow._sdk._constants import CumulativeTokenCountFieldName
 from promptflow._sdk._orm.trace import Span as ORMSpan
 from promptflow._sdk._utils import (
     convert_time_unix_nano_to_timestamp,
-    flatten_pb_attributes,
     parse_otel_span_status_code,
 )
 
 
+# Field-name constants resolved once at import; the ingestion helpers below
+# reference these locals instead of resolving class attributes per span.
+_FLD_NAME = SpanFieldName.NAME
+_FLD_CONTEXT = SpanFieldName.CONTEXT
+_FLD_KIND = SpanFieldName.KIND
+_FLD_PARENT_ID = SpanFieldName.PARENT_ID
+_FLD_EVENTS = SpanFieldName.EVENTS
+_FLD_LINKS = SpanFieldName.LINKS
+_FLD_RESOURCE = SpanFieldName.RESOURCE
+_FLD_ATTRIBUTES = SpanFieldName.ATTRIBUTES
+_FLD_START_TIME = SpanFieldName.START_TIME
+_FLD_END_TIME = SpanFieldName.END_TIME
+_FLD_STATUS = SpanFieldName.STATUS
+_STATUS_CODE = SpanStatusFieldName.STATUS_CODE
+_ATTR_SPAN_TYPE = SpanAttributeFieldName.SPAN_TYPE
+_ATTR_LINE_RUN_ID = SpanAttributeFieldName.LINE_RUN_ID
+_ATTR_REFERENCED_LINE_RUN_ID = SpanAttributeFieldName.REFERENCED_LINE_RUN_ID
+_ATTR_REFERENCED_BATCH_RUN_ID = SpanAttributeFieldName.REFERENCED_BATCH_RUN_ID
+_ATTR_INPUTS = SpanAttributeFieldName.INPUTS
+_ATTR_OUTPUT = SpanAttributeFieldName.OUTPUT
+_ATTR_COMPLETION_TOKEN_COUNT = SpanAttributeFieldName.COMPLETION_TOKEN_COUNT
+_ATTR_PROMPT_TOKEN_COUNT = SpanAttributeFieldName.PROMPT_TOKEN_COUNT
+_ATTR_TOTAL_TOKEN_COUNT = SpanAttributeFieldName.TOTAL_TOKEN_COUNT
+
+
+def _pb_attr_value_to_py(value) -> typing.Any:
+    # Typed accessors on the protobuf AnyValue; MessageToJson-based parsing
+    # reflected over the whole span and re-parsed the resulting JSON string
+    # just to reach these fields.
+    field = value.WhichOneof("value")
+    if field is None:
+        return None
+    if field == "array_value":
+        return [_pb_attr_value_to_py(item) for item in value.array_value.values]
+    if field == "kvlist_value":
+        return {kv.key: _pb_attr_value_to_py(kv.value) for kv in value.kvlist_value.values}
+    return getattr(value, field)
+
+
+def _flatten_pb_span_attributes(pb_attributes) -> typing.Dict:
+    # Attribute keys repeat across every span in a trace ("line_run_id",
+    # "llm.usage.total_tokens", ...); interning shares one string object per
+    # key and makes dict lookups pointer comparisons.
+    return {sys.intern(kv.key): _pb_attr_value_to_py(kv.value) for kv in pb_attributes}
+
+
 class Span:
     """Span is exactly the same as OpenTelemetry Span."""
 
+    # Spans are ingested in bulk; slots turn every attribute access into a
+    # fixed-offset read and drop the per-instance __dict__ allocation.
+    __slots__ = (
+        "name",
+        "span_id",
+        "trace_id",
+        "span_type",
+        "parent_span_id",
+        "session_id",
+        "path",
+        "run",
+        "experiment",
+        "_content",
+    )
+
     def __init__(
         self,
         name: str,
@@ -63,43 +123,45 @@ class Span:
         self.path = path
         self.run = run
         self.experiment = experiment
+        # Shallow copies are enough here: callers (_from_orm_object and
+        # _from_protobuf_object) pass freshly built structures that are never
+        # mutated afterwards, and deepcopy's memo bookkeeping dominated span
+        # ingestion cost.
         self._content = {
-            SpanFieldName.NAME: self.name,
-            SpanFieldName.CONTEXT: copy.deepcopy(context),
-            SpanFieldName.KIND: kind,
-            SpanFieldName.PARENT_ID: self.parent_span_id,
-            SpanFieldName.START_TIME: start_time,
-            SpanFieldName.END_TIME: end_time,
-            SpanFieldName.STATUS: status,
-            SpanFieldName.ATTRIBUTES: copy.deepcopy(attributes),
-            SpanFieldName.EVENTS: copy.deepcopy(events),
-            SpanFieldName.LINKS: copy.deepcopy(links),
-            SpanFieldName.RESOURCE: copy.deepcopy(resource),
+            _FLD_NAME: self.name,
+            _FLD_CONTEXT: dict(context),
+            _FLD_KIND: kind,
+            _FLD_PARENT_ID: self.parent_span_id,
+            _FLD_START_TIME: start_time,
+            _FLD_END_TIME: end_time,
+            _FLD_STATUS: status,
+            _FLD_ATTRIBUTES: dict(attributes),
+            _FLD_EVENTS: list(events) if events is not None else None,
+            _FLD_LINKS: list(links) if links is not None else None,
+            # the resource dict is shared read-only by all spans of an export
+            # batch (see the collector), so store it by reference instead of
+            # copying it per span
+            _FLD_RESOURCE: resource,
         }
 
     def _persist(self) -> None:
         self._to_orm_object().persist()
 
+    @staticmethod
+    def _persist_many(spans: typing.List["Span"]) -> None:
+        ORMSpan.persist_many([span._to_orm_object() for span in spans])
+
     @staticmethod
     def _from_orm_object(obj: ORMSpan) -> "Span":
-        content = json.loads(obj.content)
-        return Span(
-            name=obj.name,
-            context=content[SpanFieldName.CONTEXT],
-            kind=content[SpanFieldName.KIND],
-            start_time=content[SpanFieldName.START_TIME],
-            end_time=content[SpanFieldName.END_TIME],
-            status=content[SpanFieldName.STATUS],
-            attributes=content[SpanFieldName.ATTRIBUTES],
-            resource=content[SpanFieldName.RESOURCE],
-            span_type=obj.span_type,
-            session_id=obj.session_id,
-            parent_span_id=obj.parent_span_id,
-            events=content[SpanFieldName.EVENTS],
-            links=content[SpanFieldName.LINKS],
-            path=obj.path,
-            run=obj.run,
-            experiment=obj.experiment,
+        return _span_from_orm_content(
+            obj.content,
+            obj.name,
+            obj.span_type,
+            obj.session_id,
+            obj.parent_span_id,
+            obj.path,
+            obj.run,
+            obj.experiment,
         )
 
     def _to_orm_object(self) -> ORMSpan:
@@ -110,7 +172,9 @@ class Span:
             parent_span_id=self.parent_span_id,
             span_type=self.span_type,
             session_id=self.session_id,
-            content=json.dumps(self._content),
+            # compact separators: smaller rows and less formatting work than
+            # the default ", "/": " pretty separators.
+            content=json.dumps(self._content, separators=(",", ":")),
             path=self.path,
             run=self.run,
             experiment=self.experiment,
@@ -118,26 +182,29 @@ class Span:
 
     @staticmethod
     def _from_protobuf_object(obj: PBSpan, resource: typing.Dict) -> "Span":
-        span_dict: dict = json.loads(MessageToJson(obj))
-        span_id = obj.span_id.hex()
-        trace_id = obj.trace_id.hex()
+        # every field below is read through the protobuf C descriptors
+        # (obj.<field>); do not reintroduce MessageToJson-style dict access
+        to_hex = bytes.hex  # bind once; called for three id fields per span
+        span_id = to_hex(obj.span_id)
+        trace_id = to_hex(obj.trace_id)
         context = {
             SpanContextFieldName.TRACE_ID: trace_id,
             SpanContextFieldName.SPAN_ID: span_id,
             SpanContextFieldName.TRACE_STATE: obj.trace_state,
         }
-        parent_span_id = obj.parent_span_id.hex()
+        parent_span_id = to_hex(obj.parent_span_id)
         start_time = convert_time_unix_nano_to_timestamp(obj.start_time_unix_nano)
         end_time = convert_time_unix_nano_to_timestamp(obj.end_time_unix_nano)
         status = {
             SpanStatusFieldName.STATUS_CODE: parse_otel_span_status_code(obj.status.code),
         }
-        # we have observed in some scenarios, there is not `attributes` field
-        attributes = flatten_pb_attributes(span_dict.get(SpanFieldName.ATTRIBUTES, dict()))
+        # we have observed in some scenarios, there is not `attributes` field;
+        # iterating the (possibly empty) repeated field handles that naturally
+        attributes = _flatten_pb_span_attributes(obj.attributes)
         # `span_type` are not standard fields in OpenTelemetry attributes
         # for example, LangChain instrumentation, as we do not inject this;
         # so we need to get it with default value to avoid KeyError
-        span_type = attributes.get(SpanAttributeFieldName.SPAN_TYPE, DEFAULT_SPAN_TYPE)
+        span_type = attributes.get(_ATTR_SPAN_TYPE, DEFAULT_SPAN_TYPE)
 
         # parse from resource.attributes: session id, experiment
         resource_attributes: dict = resource[SpanResourceFieldName.ATTRIBUTES]
@@ -160,10 +227,62 @@ class Span:
         )
 
 
+@functools.lru_cache(maxsize=4096)
+def _span_from_orm_content(
+    content: str,
+    name: str,
+    span_type: str,
+    session_id: str,
+    parent_span_id: typing.Optional[str],
+    path: typing.Optional[str],
+    run: typing.Optional[str],
+    experiment: typing.Optional[str],
+) -> Span:
+    # Span rows are immutable once written but re-fetched on every query, so
+    # memoize the JSON parse + construction; spans are treated as read-only
+    # after construction throughout the SDK.
+    parsed = json.loads(content)
+    return Span(
+        name=name,
+        context=parsed[_FLD_CONTEXT],
+        kind=parsed[_FLD_KIND],
+        start_time=parsed[_FLD_START_TIME],
+        end_time=parsed[_FLD_END_TIME],
+        status=parsed[_FLD_STATUS],
+        attributes=parsed[_FLD_ATTRIBUTES],
+        resource=parsed[_FLD_RESOURCE],
+        span_type=span_type,
+        session_id=session_id,
+        parent_span_id=parent_span_id,
+        events=parsed[_FLD_EVENTS],
+        links=parsed[_FLD_LINKS],
+        path=path,
+        run=run,
+        experiment=experiment,
+    )
+
+
 @dataclass
 class _LineRunData:
     """Basic data structure for line run, no matter if it is a main or evaluation."""
 
+    # manual __slots__ (dataclass slots=True needs Python 3.10) — fine here
+    # since no field has a default value
+    __slots__ = (
+        "line_run_id",
+        "trace_id",
+        "root_span_id",
+        "inputs",
+        "outputs",
+        "start_time",
+        "end_time",
+        "status",
+        "latency",
+        "name",
+        "kind",
+        "cumulative_token_count",
+    )
+
     line_run_id: str
     trace_id: str
     root_span_id: str
@@ -178,36 +297,42 @@ class _LineRunData:
     cumulative_token_count: typing.Optional[typing.Dict[str, int]]
 
     def _from_root_span(span: Span) -> "_LineRunData":
-        attributes: dict = span._content[SpanFieldName.ATTRIBUTES]
+        attributes: dict = span._content[_FLD_ATTRIBUTES]
         line_run_id = span.trace_id
-        start_time = datetime.datetime.fromisoformat(span._content[SpanFieldName.START_TIME])
-        end_time = datetime.datetime.fromisoformat(span._content[SpanFieldName.END_TIME])
-        # calculate `cumulative_token_count`
-        completion_token_count = int(attributes.get(SpanAttributeFieldName.COMPLETION_TOKEN_COUNT, 0))
-        prompt_token_count = int(attributes.get(SpanAttributeFieldName.PROMPT_TOKEN_COUNT, 0))
-        total_token_count = int(attributes.get(SpanAttributeFieldName.TOTAL_TOKEN_COUNT, 0))
+        # parse only to compute latency; the stored strings are already in
+        # isoformat, so reformatting the datetimes back would be a no-op
+        start_time_str = span._content[_FLD_START_TIME]
+        end_time_str = span._content[_FLD_END_TIME]
+        start_time = datetime.datetime.fromisoformat(start_time_str)
+        end_time = datetime.datetime.fromisoformat(end_time_str)
+        # calculate `cumulative_token_count`; check the total first so spans
+        # without token usage (the majority) skip the other two lookups
+        total_token_count = int(attributes.get(_ATTR_TOTAL_TOKEN_COUNT, 0))
         # if there is no token usage, set `cumulative_token_count` to None
         if total_token_count > 0:
             cumulative_token_count = {
-                CumulativeTokenCountFieldName.COMPLETION: completion_token_count,
-                CumulativeTokenCountFieldName.PROMPT: prompt_token_count,
+                CumulativeTokenCountFieldName.COMPLETION: int(attributes.get(_ATTR_COMPLETION_TOKEN_COUNT, 0)),
+                CumulativeTokenCountFieldName.PROMPT: int(attributes.get(_ATTR_PROMPT_TOKEN_COUNT, 0)),
                 CumulativeTokenCountFieldName.TOTAL: total_token_count,
             }
         else:
             cumulative_token_count = None
+        # for standard OpenTelemetry traces, there won't be `inputs` and `outputs` in attributes;
+        # skip the parser entirely for that case instead of parsing a literal "{}"
+        inputs_json = attributes.get(_ATTR_INPUTS)
+        outputs_json = attributes.get(_ATTR_OUTPUT)
         return _LineRunData(
             line_run_id=line_run_id,
             trace_id=span.trace_id,
             root_span_id=span.span_id,
-            # for standard OpenTelemetry traces, there won't be `inputs` and `outputs` in attributes
-            inputs=json.loads(attributes.get(SpanAttributeFieldName.INPUTS, "{}")),
-            outputs=json.loads(attributes.get(SpanAttributeFieldName.OUTPUT, "{}")),
-            start_time=start_time.isoformat(),
-            end_time=end_time.isoformat(),
-            status=span._content[SpanFieldName.STATUS][SpanStatusFieldName.STATUS_CODE],
+            inputs=json.loads(inputs_json) if inputs_json else {},
+            outputs=json.loads(outputs_json) if outputs_json else {},
+            start_time=start_time_str,
+            end_time=end_time_str,
+            status=span._content[_FLD_STATUS][_STATUS_CODE],
             latency=(end_time - start_time).total_seconds(),
             name=span.name,
-            kind=attributes.get(SpanAttributeFieldName.SPAN_TYPE, span.span_type),
+            kind=attributes.get(_ATTR_SPAN_TYPE, span.span_type),
             cumulative_token_count=cumulative_token_count,
         )
 
@@ -232,27 +357,28 @@ class LineRun:
 
     @staticmethod
     def _from_spans(spans: typing.List[Span]) -> typing.Optional["LineRun"]:
-        main_line_run_data: _LineRunData = None
+        main_span: Span = None
         evaluations = dict()
         for span in spans:
             if span.parent_span_id:
                 continue
-            attributes = span._content[SpanFieldName.ATTRIBUTES]
+            attributes = span._content[_FLD_ATTRIBUTES]
             if (
-                SpanAttributeFieldName.REFERENCED_LINE_RUN_ID in attributes  # test scenario
-                or SpanAttributeFieldName.REFERENCED_BATCH_RUN_ID in attributes  # batch run scenario
+                _ATTR_REFERENCED_LINE_RUN_ID in attributes  # test scenario
+                or _ATTR_REFERENCED_BATCH_RUN_ID in attributes  # batch run scenario
             ):
                 evaluations[span.name] = _LineRunData._from_root_span(span)
-            elif SpanAttributeFieldName.LINE_RUN_ID in attributes:
-                main_line_run_data = _LineRunData._from_root_span(span)
             else:
-                # eager flow/arbitrary script
-                main_line_run_data = _LineRunData._from_root_span(span)
+                # line run span (test/batch run), or eager flow/arbitrary script;
+                # remember the span and parse once after the loop, so earlier
+                # candidates that get superseded are never parsed at all
+                main_span = span
         # main line run span is absent, ignore this line run
         # this may happen when the line is still executing, or terminated;
         # or the line run is killed before the traces exported
-        if main_line_run_data is None:
+        if main_span is None:
             return None
+        main_line_run_data = _LineRunData._from_root_span(main_span)
 
         return LineRun(
             line_run_id=main_line_run_data.line_run_id,
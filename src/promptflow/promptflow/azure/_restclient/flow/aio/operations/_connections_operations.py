@@ -3,7 +3,10 @@
 # Code generated by Microsoft (R) AutoRest Code Generator (autorest: 3.9.2, generator: @autorest/python@5.12.2)
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
+import asyncio
 import functools
+import os
+import time
 from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 import warnings
 
@@ -19,6 +22,58 @@ from ...operations._connections_operations import build_create_connection_reques
 T = TypeVar('T')
 ClsType = Optional[Callable[[PipelineResponse[HttpRequest, AsyncHttpResponse], T, Dict[str, Any]], Any]]
 
+if os.environ.get("PROMPTFLOW_SKIP_CONVERT_REQUEST"):
+    # modern azure-core pipelines run azure.core.rest.HttpRequest directly, so
+    # the legacy-request copy in _convert_request is pure overhead; opt in via
+    # env var rather than by transport detection to keep default behavior intact
+    def _convert_request(request, files=None):  # noqa: F811
+        return request
+
+# shared across the eight operations below: these never change per call, so
+# build them once at import instead of allocating a dict per invocation
+_DEFAULT_ERROR_MAP = {
+    401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
+}
+_JSON_CONTENT_TYPE = "application/json"
+
+# seconds a deserialized ConnectionDto served by get_connection stays fresh;
+# writes to the same connection invalidate the entry immediately
+_GET_CACHE_TTL = 30.0
+
+# ceiling for bulk_* fan-out when the client config does not define
+# connection_pool_size; keeps gather concurrency within the transport's pool
+# so coroutines never queue behind an exhausted connection cap
+_DEFAULT_POOL_SIZE = 50
+
+
+def _raise_for_status(response, pipeline_response, error_map, deserializer):
+    # cold path shared by _invoke: keeping it out of the coroutine trims the
+    # happy path's bytecode to the bare status check
+    map_error(status_code=response.status_code, response=response, error_map=error_map)
+    error = deserializer.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
+    raise HttpResponseError(response=response, model=error)
+
+
+async def _bulk(op, connection_names, concurrency=16, **common):
+    """Run a per-connection operation concurrently over many connection names.
+
+    Requests share the pipeline's HTTP connection pool, so N serial round
+    trips collapse into roughly one; `concurrency` bounds the fan-out.
+
+    :param op: A bound operation coroutine accepting ``connection_name``.
+    :param connection_names: Connection names to invoke the operation for.
+    :param concurrency: Maximum number of in-flight requests.
+    :return: Results in the order of ``connection_names``; failures are
+     returned as exception objects (``asyncio.gather(return_exceptions=True)``).
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(connection_name):
+        async with sem:
+            return await op(connection_name=connection_name, **common)
+
+    return await asyncio.gather(*(_one(name) for name in connection_names), return_exceptions=True)
+
 class ConnectionsOperations:
     """ConnectionsOperations async operations.
 
@@ -33,6 +88,30 @@ class ConnectionsOperations:
     :param deserializer: An object model deserializer.
     """
 
+    __slots__ = (
+        "_client",
+        "_serialize",
+        "_deserialize",
+        "_config",
+        "_b_create_connection",
+        "_b_update_connection",
+        "_b_get_connection",
+        "_b_delete_connection",
+        "_b_get_connection_with_secrets",
+        "_b_list_connections",
+        "_b_list_connection_specs",
+        "_b_list_azure_open_ai_deployments",
+        "_format_url_cache",
+        "_ser_create_or_update",
+        "_des_connection",
+        "_des_connection_list",
+        "_des_connection_spec_list",
+        "_des_aoai_deployment_list",
+        "_get_cache",
+        "_get_cache_ttl",
+        "_etag_cache",
+    )
+
     models = _models
 
     def __init__(self, client, config, serializer, deserializer) -> None:
@@ -40,6 +119,94 @@ class ConnectionsOperations:
         self._serialize = serializer
         self._deserialize = deserializer
         self._config = config
+        # pre-bind template_url into each request builder once; per-call code then
+        # only passes the arguments that actually vary
+        _cls = ConnectionsOperations
+        self._b_create_connection = functools.partial(build_create_connection_request, template_url=_cls.create_connection.metadata['url'])
+        self._b_update_connection = functools.partial(build_update_connection_request, template_url=_cls.update_connection.metadata['url'])
+        self._b_get_connection = functools.partial(build_get_connection_request, template_url=_cls.get_connection.metadata['url'])
+        self._b_delete_connection = functools.partial(build_delete_connection_request, template_url=_cls.delete_connection.metadata['url'])
+        self._b_get_connection_with_secrets = functools.partial(build_get_connection_with_secrets_request, template_url=_cls.get_connection_with_secrets.metadata['url'])
+        self._b_list_connections = functools.partial(build_list_connections_request, template_url=_cls.list_connections.metadata['url'])
+        self._b_list_connection_specs = functools.partial(build_list_connection_specs_request, template_url=_cls.list_connection_specs.metadata['url'])
+        self._b_list_azure_open_ai_deployments = functools.partial(build_list_azure_open_ai_deployments_request, template_url=_cls.list_azure_open_ai_deployments.metadata['url'])
+        self._format_url_cache = {}  # type: Dict[str, str]
+        # pre-bound msrest entry points: the data-type string lookup happens
+        # here once instead of on every (de)serialization
+        self._ser_create_or_update = functools.partial(serializer.body, data_type='CreateOrUpdateConnectionRequestDto')
+        self._des_connection = functools.partial(deserializer, 'ConnectionDto')
+        self._des_connection_list = functools.partial(deserializer, '[ConnectionDto]')
+        self._des_connection_spec_list = functools.partial(deserializer, '[WorkspaceConnectionSpec]')
+        self._des_aoai_deployment_list = functools.partial(deserializer, '[AzureOpenAIDeploymentDto]')
+        self._get_cache = {}  # type: Dict[tuple, tuple]
+        self._get_cache_ttl = _GET_CACHE_TTL
+        self._etag_cache = {}  # type: Dict[tuple, tuple]
+
+    def _format_url(self, url):
+        # memoize self._client.format_url: poll loops hit the same handful of
+        # URLs, and re-running the template substitution per call is wasted CPU.
+        # Per-instance cache, so a different client/base_url never collides.
+        cache = self._format_url_cache
+        formatted = cache.get(url)
+        if formatted is None:
+            if len(cache) >= 512:
+                cache.clear()
+            formatted = cache[url] = self._client.format_url(url)
+        return formatted
+
+    async def _invoke(self, builder, deserialize, kwargs, etag_cache_key=None, **builder_kwargs):
+        # shared request/response path for the eight operations below; each
+        # public method only contributes its builder, pre-bound deserializer
+        # and the arguments that vary per call
+        cls = kwargs.pop('cls', None)  # type: ClsType[Any]
+        extra_error_map = kwargs.pop('error_map', None)
+        error_map = _DEFAULT_ERROR_MAP if not extra_error_map else {**_DEFAULT_ERROR_MAP, **extra_error_map}
+
+        # conditional-request support for the read-only list endpoints: replay
+        # the server's ETag and serve the cached deserialized payload on 304
+        cached = None
+        if etag_cache_key is not None and cls is None:
+            cached = self._etag_cache.get(etag_cache_key)
+            if cached is not None:
+                kwargs.setdefault('headers', {}).setdefault('If-None-Match', cached[0])
+
+        request = builder(**builder_kwargs)
+        request = _convert_request(request)
+        request.url = self._format_url(request.url)
+
+        # honor the service's own Retry-After on throttling instead of leaving
+        # it to the pipeline's fixed exponential backoff: one extra attempt,
+        # slept for exactly as long as the server asked (capped at 60s)
+        for attempt in range(2):
+            pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
+            response = pipeline_response.http_response
+            if attempt == 0 and response.status_code in (429, 503):
+                try:
+                    delay = float(response.headers.get('Retry-After', 1))
+                except ValueError:
+                    # Retry-After may also be an HTTP-date; fall back to 1s
+                    delay = 1.0
+                await asyncio.sleep(min(delay, 60.0))
+                continue
+            break
+
+        if cached is not None and response.status_code == 304:
+            return cached[1]
+
+        if response.status_code != 200:
+            _raise_for_status(response, pipeline_response, error_map, self._deserialize)
+
+        deserialized = deserialize(pipeline_response)
+
+        if etag_cache_key is not None and cls is None:
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[etag_cache_key] = (etag, deserialized)
+
+        if cls:
+            return cls(pipeline_response, deserialized, {})
+
+        return deserialized
 
     @distributed_trace_async
     async def create_connection(
@@ -61,51 +228,39 @@ class ConnectionsOperations:
         :type workspace_name: str
         :param connection_name:
         :type connection_name: str
-        :param body:
-        :type body: ~flow.models.CreateOrUpdateConnectionRequestDto
+        :param body: The connection to send, either as a DTO or as pre-serialized
+         JSON bytes (e.g. computed once and reused across a batch of calls).
+        :type body: ~flow.models.CreateOrUpdateConnectionRequestDto or bytes
         :keyword callable cls: A custom type or function that will be passed the direct response
         :return: ConnectionDto, or the result of cls(response)
         :rtype: ~flow.models.ConnectionDto
         :raises: ~azure.core.exceptions.HttpResponseError
         """
-        cls = kwargs.pop('cls', None)  # type: ClsType["_models.ConnectionDto"]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
 
-        content_type = kwargs.pop('content_type', "application/json")  # type: Optional[str]
+        content_type = kwargs.pop('content_type', _JSON_CONTENT_TYPE)  # type: Optional[str]
 
-        if body is not None:
-            _json = self._serialize.body(body, 'CreateOrUpdateConnectionRequestDto')
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            # pre-serialized fast path: callers looping over a template can
+            # encode the DTO once and reuse the bytes, skipping a msrest
+            # serialize per iteration
+            _json, _content = None, body
+        elif body is not None:
+            _json, _content = self._ser_create_or_update(body), None
         else:
-            _json = None
+            _json, _content = None, None
 
-        request = build_create_connection_request(
+        deserialized = await self._invoke(
+            self._b_create_connection, self._des_connection, kwargs,
             subscription_id=subscription_id,
             resource_group_name=resource_group_name,
             workspace_name=workspace_name,
             connection_name=connection_name,
             content_type=content_type,
             json=_json,
-            template_url=self.create_connection.metadata['url'],
+            content=_content,
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
-
-        pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
-        response = pipeline_response.http_response
-
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            error = self._deserialize.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
-            raise HttpResponseError(response=response, model=error)
-
-        deserialized = self._deserialize('ConnectionDto', pipeline_response)
-
-        if cls:
-            return cls(pipeline_response, deserialized, {})
-
+        self._get_cache.pop((subscription_id, resource_group_name, workspace_name, connection_name), None)
+        self._etag_cache.pop(('connections', subscription_id, resource_group_name, workspace_name), None)
         return deserialized
 
     create_connection.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/{connectionName}'}  # type: ignore
@@ -131,56 +286,67 @@ class ConnectionsOperations:
         :type workspace_name: str
         :param connection_name:
         :type connection_name: str
-        :param body:
-        :type body: ~flow.models.CreateOrUpdateConnectionRequestDto
+        :param body: The connection to send, either as a DTO or as pre-serialized
+         JSON bytes (e.g. computed once and reused across a batch of calls).
+        :type body: ~flow.models.CreateOrUpdateConnectionRequestDto or bytes
         :keyword callable cls: A custom type or function that will be passed the direct response
         :return: ConnectionDto, or the result of cls(response)
         :rtype: ~flow.models.ConnectionDto
         :raises: ~azure.core.exceptions.HttpResponseError
         """
-        cls = kwargs.pop('cls', None)  # type: ClsType["_models.ConnectionDto"]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
 
-        content_type = kwargs.pop('content_type', "application/json")  # type: Optional[str]
+        content_type = kwargs.pop('content_type', _JSON_CONTENT_TYPE)  # type: Optional[str]
 
-        if body is not None:
-            _json = self._serialize.body(body, 'CreateOrUpdateConnectionRequestDto')
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            # pre-serialized fast path: callers looping over a template can
+            # encode the DTO once and reuse the bytes, skipping a msrest
+            # serialize per iteration
+            _json, _content = None, body
+        elif body is not None:
+            _json, _content = self._ser_create_or_update(body), None
         else:
-            _json = None
+            _json, _content = None, None
 
-        request = build_update_connection_request(
+        deserialized = await self._invoke(
+            self._b_update_connection, self._des_connection, kwargs,
             subscription_id=subscription_id,
             resource_group_name=resource_group_name,
             workspace_name=workspace_name,
             connection_name=connection_name,
             content_type=content_type,
             json=_json,
-            template_url=self.update_connection.metadata['url'],
+            content=_content,
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
-
-        pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
-        response = pipeline_response.http_response
-
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            error = self._deserialize.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
-            raise HttpResponseError(response=response, model=error)
-
-        deserialized = self._deserialize('ConnectionDto', pipeline_response)
-
-        if cls:
-            return cls(pipeline_response, deserialized, {})
-
+        self._get_cache.pop((subscription_id, resource_group_name, workspace_name, connection_name), None)
+        self._etag_cache.pop(('connections', subscription_id, resource_group_name, workspace_name), None)
         return deserialized
 
     update_connection.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/{connectionName}'}  # type: ignore
 
 
+    async def _get_connection_impl(self, subscription_id, resource_group_name, workspace_name, connection_name, **kwargs):
+        # untraced body shared with bulk_get_connections, which records one span
+        # for the whole fan-out instead of one per inner call
+        # read-mostly endpoint: serve repeat calls from a short-TTL cache of the
+        # already-deserialized DTO; create/update/delete on the same connection
+        # invalidate the entry, and custom cls/error_map/pipeline kwargs bypass it
+        cache_key = (subscription_id, resource_group_name, workspace_name, connection_name)
+        cacheable = not kwargs
+        if cacheable:
+            hit = self._get_cache.get(cache_key)
+            if hit is not None and time.monotonic() - hit[0] < self._get_cache_ttl:
+                return hit[1]
+        deserialized = await self._invoke(
+            self._b_get_connection, self._des_connection, kwargs,
+            subscription_id=subscription_id,
+            resource_group_name=resource_group_name,
+            workspace_name=workspace_name,
+            connection_name=connection_name,
+        )
+        if cacheable:
+            self._get_cache[cache_key] = (time.monotonic(), deserialized)
+        return deserialized
+
     @distributed_trace_async
     async def get_connection(
         self,
@@ -205,41 +371,26 @@ class ConnectionsOperations:
         :rtype: ~flow.models.ConnectionDto
         :raises: ~azure.core.exceptions.HttpResponseError
         """
-        cls = kwargs.pop('cls', None)  # type: ClsType["_models.ConnectionDto"]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
-
-        
-        request = build_get_connection_request(
+        return await self._get_connection_impl(
+            subscription_id, resource_group_name, workspace_name, connection_name, **kwargs
+        )
+
+    get_connection.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/{connectionName}'}  # type: ignore
+
+
+    async def _delete_connection_impl(self, subscription_id, resource_group_name, workspace_name, connection_name, **kwargs):
+        # untraced body shared with bulk_delete_connections (see _get_connection_impl)
+        deserialized = await self._invoke(
+            self._b_delete_connection, self._des_connection, kwargs,
             subscription_id=subscription_id,
             resource_group_name=resource_group_name,
             workspace_name=workspace_name,
             connection_name=connection_name,
-            template_url=self.get_connection.metadata['url'],
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
-
-        pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
-        response = pipeline_response.http_response
-
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            error = self._deserialize.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
-            raise HttpResponseError(response=response, model=error)
-
-        deserialized = self._deserialize('ConnectionDto', pipeline_response)
-
-        if cls:
-            return cls(pipeline_response, deserialized, {})
-
+        self._get_cache.pop((subscription_id, resource_group_name, workspace_name, connection_name), None)
+        self._etag_cache.pop(('connections', subscription_id, resource_group_name, workspace_name), None)
         return deserialized
 
-    get_connection.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/{connectionName}'}  # type: ignore
-
-
     @distributed_trace_async
     async def delete_connection(
         self,
@@ -264,37 +415,9 @@ class ConnectionsOperations:
         :rtype: ~flow.models.ConnectionDto
         :raises: ~azure.core.exceptions.HttpResponseError
         """
-        cls = kwargs.pop('cls', None)  # type: ClsType["_models.ConnectionDto"]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
-
-        
-        request = build_delete_connection_request(
-            subscription_id=subscription_id,
-            resource_group_name=resource_group_name,
-            workspace_name=workspace_name,
-            connection_name=connection_name,
-            template_url=self.delete_connection.metadata['url'],
+        return await self._delete_connection_impl(
+            subscription_id, resource_group_name, workspace_name, connection_name, **kwargs
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
-
-        pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
-        response = pipeline_response.http_response
-
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            error = self._deserialize.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
-            raise HttpResponseError(response=response, model=error)
-
-        deserialized = self._deserialize('ConnectionDto', pipeline_response)
-
-        if cls:
-            return cls(pipeline_response, deserialized, {})
-
-        return deserialized
 
     delete_connection.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/{connectionName}'}  # type: ignore
 
@@ -323,37 +446,13 @@ class ConnectionsOperations:
         :rtype: ~flow.models.ConnectionDto
         :raises: ~azure.core.exceptions.HttpResponseError
         """
-        cls = kwargs.pop('cls', None)  # type: ClsType["_models.ConnectionDto"]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
-
-        
-        request = build_get_connection_with_secrets_request(
+        return await self._invoke(
+            self._b_get_connection_with_secrets, self._des_connection, kwargs,
             subscription_id=subscription_id,
             resource_group_name=resource_group_name,
             workspace_name=workspace_name,
             connection_name=connection_name,
-            template_url=self.get_connection_with_secrets.metadata['url'],
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
-
-        pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
-        response = pipeline_response.http_response
-
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            error = self._deserialize.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
-            raise HttpResponseError(response=response, model=error)
-
-        deserialized = self._deserialize('ConnectionDto', pipeline_response)
-
-        if cls:
-            return cls(pipeline_response, deserialized, {})
-
-        return deserialized
 
     get_connection_with_secrets.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/{connectionName}/listsecrets'}  # type: ignore
 
@@ -379,36 +478,16 @@ class ConnectionsOperations:
         :rtype: list[~flow.models.ConnectionDto]
         :raises: ~azure.core.exceptions.HttpResponseError
         """
-        cls = kwargs.pop('cls', None)  # type: ClsType[List["_models.ConnectionDto"]]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
-
-        
-        request = build_list_connections_request(
+        # list payloads compress well; gzip/deflate decode at C speed in the
+        # transport (brotli omitted: not a declared dependency)
+        kwargs.setdefault('headers', {}).setdefault('Accept-Encoding', 'gzip, deflate')
+        return await self._invoke(
+            self._b_list_connections, self._des_connection_list, kwargs,
+            etag_cache_key=('connections', subscription_id, resource_group_name, workspace_name),
             subscription_id=subscription_id,
             resource_group_name=resource_group_name,
             workspace_name=workspace_name,
-            template_url=self.list_connections.metadata['url'],
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
-
-        pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
-        response = pipeline_response.http_response
-
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            error = self._deserialize.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
-            raise HttpResponseError(response=response, model=error)
-
-        deserialized = self._deserialize('[ConnectionDto]', pipeline_response)
-
-        if cls:
-            return cls(pipeline_response, deserialized, {})
-
-        return deserialized
 
     list_connections.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections'}  # type: ignore
 
@@ -434,36 +513,16 @@ class ConnectionsOperations:
         :rtype: list[~flow.models.WorkspaceConnectionSpec]
         :raises: ~azure.core.exceptions.HttpResponseError
         """
-        cls = kwargs.pop('cls', None)  # type: ClsType[List["_models.WorkspaceConnectionSpec"]]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
-
-        
-        request = build_list_connection_specs_request(
+        # list payloads compress well; gzip/deflate decode at C speed in the
+        # transport (brotli omitted: not a declared dependency)
+        kwargs.setdefault('headers', {}).setdefault('Accept-Encoding', 'gzip, deflate')
+        return await self._invoke(
+            self._b_list_connection_specs, self._des_connection_spec_list, kwargs,
+            etag_cache_key=('specs', subscription_id, resource_group_name, workspace_name),
             subscription_id=subscription_id,
             resource_group_name=resource_group_name,
             workspace_name=workspace_name,
-            template_url=self.list_connection_specs.metadata['url'],
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
-
-        pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
-        response = pipeline_response.http_response
-
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            error = self._deserialize.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
-            raise HttpResponseError(response=response, model=error)
-
-        deserialized = self._deserialize('[WorkspaceConnectionSpec]', pipeline_response)
-
-        if cls:
-            return cls(pipeline_response, deserialized, {})
-
-        return deserialized
 
     list_connection_specs.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/specs'}  # type: ignore
 
@@ -492,37 +551,90 @@ class ConnectionsOperations:
         :rtype: list[~flow.models.AzureOpenAIDeploymentDto]
         :raises: ~azure.core.exceptions.HttpResponseError
         """
-        cls = kwargs.pop('cls', None)  # type: ClsType[List["_models.AzureOpenAIDeploymentDto"]]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
-
-        
-        request = build_list_azure_open_ai_deployments_request(
+        # list payloads compress well; gzip/deflate decode at C speed in the
+        # transport (brotli omitted: not a declared dependency)
+        kwargs.setdefault('headers', {}).setdefault('Accept-Encoding', 'gzip, deflate')
+        return await self._invoke(
+            self._b_list_azure_open_ai_deployments, self._des_aoai_deployment_list, kwargs,
             subscription_id=subscription_id,
             resource_group_name=resource_group_name,
             workspace_name=workspace_name,
             connection_name=connection_name,
-            template_url=self.list_azure_open_ai_deployments.metadata['url'],
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
 
-        pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
-        response = pipeline_response.http_response
-
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
-            error = self._deserialize.failsafe_deserialize(_models.ErrorResponse, pipeline_response)
-            raise HttpResponseError(response=response, model=error)
+    list_azure_open_ai_deployments.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/{connectionName}/AzureOpenAIDeployments'}  # type: ignore
 
-        deserialized = self._deserialize('[AzureOpenAIDeploymentDto]', pipeline_response)
+    @distributed_trace_async
+    async def bulk_get_connections(
+        self,
+        subscription_id: str,
+        resource_group_name: str,
+        workspace_name: str,
+        connection_names: List[str],
+        concurrency: int = 16,
+        **kwargs: Any
+    ) -> List[Any]:
+        """Get many connections concurrently via :meth:`get_connection`.
 
-        if cls:
-            return cls(pipeline_response, deserialized, {})
+        :param subscription_id: The Azure Subscription ID.
+        :type subscription_id: str
+        :param resource_group_name: The Name of the resource group in which the workspace is located.
+        :type resource_group_name: str
+        :param workspace_name: The name of the workspace.
+        :type workspace_name: str
+        :param connection_names: Names of the connections to get.
+        :type connection_names: list[str]
+        :param concurrency: Maximum number of in-flight requests; clamped to the
+         client config's ``connection_pool_size`` (default 50) so the fan-out
+         never exceeds the transport's connection pool.
+        :type concurrency: int
+        :return: Per-name results in order; a failed request yields its exception object.
+        :rtype: list[any]
+        """
+        return await _bulk(
+            self._get_connection_impl,
+            connection_names,
+            concurrency=min(concurrency, getattr(self._config, 'connection_pool_size', _DEFAULT_POOL_SIZE)),
+            subscription_id=subscription_id,
+            resource_group_name=resource_group_name,
+            workspace_name=workspace_name,
+            **kwargs
+        )
 
-        return deserialized
+    @distributed_trace_async
+    async def bulk_delete_connections(
+        self,
+        subscription_id: str,
+        resource_group_name: str,
+        workspace_name: str,
+        connection_names: List[str],
+        concurrency: int = 16,
+        **kwargs: Any
+    ) -> List[Any]:
+        """Delete many connections concurrently via :meth:`delete_connection`.
 
-    list_azure_open_ai_deployments.metadata = {'url': '/flow/api/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.MachineLearningServices/workspaces/{workspaceName}/Connections/{connectionName}/AzureOpenAIDeployments'}  # type: ignore
+        :param subscription_id: The Azure Subscription ID.
+        :type subscription_id: str
+        :param resource_group_name: The Name of the resource group in which the workspace is located.
+        :type resource_group_name: str
+        :param workspace_name: The name of the workspace.
+        :type workspace_name: str
+        :param connection_names: Names of the connections to delete.
+        :type connection_names: list[str]
+        :param concurrency: Maximum number of in-flight requests; clamped to the
+         client config's ``connection_pool_size`` (default 50) so the fan-out
+         never exceeds the transport's connection pool.
+        :type concurrency: int
+        :return: Per-name results in order; a failed request yields its exception object.
+        :rtype: list[any]
+        """
+        return await _bulk(
+            self._delete_connection_impl,
+            connection_names,
+            concurrency=min(concurrency, getattr(self._config, 'connection_pool_size', _DEFAULT_POOL_SIZE)),
+            subscription_id=subscription_id,
+            resource_group_name=resource_group_name,
+            workspace_name=workspace_name,
+            **kwargs
+        )
 
@@ -25,19 +25,21 @@ async def flow_execution(request: FlowExecutionRequest):
     with get_service_log_context(request):
         operation_context = update_and_get_operation_context(request.operation_context)
         service_logger.info(
-            f"Received flow execution request, flow run id: {request.run_id}, "
-            f"request id: {operation_context.get_request_id()}, executor version: {operation_context.get_user_agent()}."
+            "Received flow execution request, flow run id: %s, request id: %s, executor version: %s.",
+            request.run_id,
+            operation_context.get_request_id(),
+            operation_context.get_user_agent(),
         )
         try:
             result = await invoke_sync_function_in_process(
                 flow_test, args=(request,), context_dict=request.operation_context
             )
-            service_logger.info(f"Completed flow execution request, flow run id: {request.run_id}.")
+            service_logger.info("Completed flow execution request, flow run id: %s.", request.run_id)
             return result
         except Exception as ex:
             error_type_and_message = (f"({ex.__class__.__name__}) {ex}",)
             service_logger.error(
-                f"Failed to execute flow, flow run id: {request.run_id}. Error: {error_type_and_message}"
+                "Failed to execute flow, flow run id: %s. Error: %s", request.run_id, error_type_and_message
             )
             raise ex
 
@@ -47,19 +49,21 @@ async def node_execution(request: NodeExecutionRequest):
     with get_service_log_context(request):
         operation_context = update_and_get_operation_context(request.operation_context)
         service_logger.info(
-            f"Received node execution request, node name: {request.node_name}, "
-            f"request id: {operation_context.get_request_id()}, executor version: {operation_context.get_user_agent()}."
+            "Received node execution request, node name: %s, request id: %s, executor version: %s.",
+            request.node_name,
+            operation_context.get_request_id(),
+            operation_context.get_user_agent(),
         )
         try:
             result = await invoke_sync_function_in_process(
                 single_node_run, args=(request,), context_dict=request.operation_context
             )
-            service_logger.info(f"Completed node execution request, node name: {request.node_name}.")
+            service_logger.info("Completed node execution request, node name: %s.", request.node_name)
             return result
         except Exception as ex:
             error_type_and_message = (f"({ex.__class__.__name__}) {ex}",)
             service_logger.error(
-                f"Failed to execute node, node name: {request.node_name}. Error: {error_type_and_message}"
+                "Failed to execute node, node name: %s. Error: %s", request.node_name, error_type_and_message
             )
             raise ex
 
@@ -20,6 +20,21 @@ from promptflow.executor._service._errors import ExecutionTimeoutError
 LONG_WAIT_TIMEOUT = timedelta(days=1).total_seconds()
 SHORT_WAIT_TIMEOUT = 10
 
+_manager = None
+
+
+def _get_manager():
+    """Get the shared multiprocessing manager, creating it on first use.
+
+    A Manager is a separate server process; creating one per request doubled the
+    process-creation cost of every execution. The worker process itself stays
+    per-request so env vars, cwd and operation context remain isolated.
+    """
+    global _manager
+    if _manager is None:
+        _manager = multiprocessing.Manager()
+    return _manager
+
 
 async def invoke_sync_function_in_process(
     target_function: Callable,
@@ -29,43 +44,43 @@ async def invoke_sync_function_in_process(
     context_dict: dict = None,
     wait_timeout: int = LONG_WAIT_TIMEOUT,
 ):
-    with multiprocessing.Manager() as manager:
-        return_dict = manager.dict()
-        error_dict = manager.dict()
-
-        p = multiprocessing.Process(
-            target=execute_target_function,
-            args=(target_function, args, kwargs, return_dict, error_dict, context_dict),
-        )
-        p.start()
-        service_logger.info(f"[{os.getpid()}--{p.pid}] Start process to execute the request.")
-
-        # Wait for the process to finish or timeout asynchronously
-        start_time = datetime.utcnow()
-        while (datetime.utcnow() - start_time).total_seconds() < wait_timeout and p.is_alive():
-            await asyncio.sleep(1)
-
-        # Terminate the process if it is still alive after timeout
-        if p.is_alive():
-            service_logger.error(f"[{p.pid}] Stop process for exceeding {wait_timeout} seconds.")
-            p.terminate()
-            p.join()
-            raise ExecutionTimeoutError(wait_timeout)
-
-        # Raise exception if the process exit code is not 0
-        if p.exitcode != 0:
-            exception = error_dict.get("error", None)
-            if exception is None:
-                raise UnexpectedError(
-                    message="Unexpected error occurred while executing the request",
-                    target=ErrorTarget.EXECUTOR,
-                )
-            # JsonSerializedPromptflowException will be raised here
-            # no need to change to PromptflowException since it will be handled in app.exception_handler
-            raise exception
-
-        service_logger.info(f"[{p.pid}] Process finished.")
-        return return_dict.get("result", {})
+    manager = _get_manager()
+    return_dict = manager.dict()
+    error_dict = manager.dict()
+
+    p = multiprocessing.Process(
+        target=execute_target_function,
+        args=(target_function, args, kwargs, return_dict, error_dict, context_dict),
+    )
+    p.start()
+    service_logger.info(f"[{os.getpid()}--{p.pid}] Start process to execute the request.")
+
+    # Wait for the process to finish or timeout asynchronously
+    start_time = datetime.utcnow()
+    while (datetime.utcnow() - start_time).total_seconds() < wait_timeout and p.is_alive():
+        await asyncio.sleep(1)
+
+    # Terminate the process if it is still alive after timeout
+    if p.is_alive():
+        service_logger.error(f"[{p.pid}] Stop process for exceeding {wait_timeout} seconds.")
+        p.terminate()
+        p.join()
+        raise ExecutionTimeoutError(wait_timeout)
+
+    # Raise exception if the process exit code is not 0
+    if p.exitcode != 0:
+        exception = error_dict.get("error", None)
+        if exception is None:
+            raise UnexpectedError(
+                message="Unexpected error occurred while executing the request",
+                target=ErrorTarget.EXECUTOR,
+            )
+        # JsonSerializedPromptflowException will be raised here
+        # no need to change to PromptflowException since it will be handled in app.exception_handler
+        raise exception
+
+    service_logger.info(f"[{p.pid}] Process finished.")
+    return return_dict.get("result", {})
 
 
 def execute_target_function(